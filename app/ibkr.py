@@ -1,15 +1,115 @@
+import asyncio
+import copy
+import csv
+import functools
 import json
+import os
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from ib_insync import Contract, IB, Stock
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
+
+# IBKR rejects clients that exceed ~50 API messages per second
+API_RATE_LIMIT = 50
+
+# Number of qualifyContracts batches allowed in flight at once
+QUALIFY_CONCURRENCY = 4
+
+# Qualified contracts are persisted here, inside the output directory
+CONTRACT_CACHE_FILE = "contract_cache.json"
+
+# Symbols IBKR could not qualify are not retried until this many seconds pass
+FAILED_CONTRACT_TTL = 7 * 24 * 3600
+
+# Characters replaced with underscores in watchlist file names
+_SAFE_NAME_TABLE = str.maketrans(" -", "__")
+
+
+class _TokenBucket:
+    """Asyncio token bucket used to pace outgoing API requests."""
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.rate = rate
+        self.capacity = capacity or int(rate)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _progress_bar(total: int, desc: str) -> tqdm:
+    """Create a progress bar that redraws at most ~200 times per run."""
+    return tqdm(total=total, desc=desc, mininterval=0.25, miniters=max(1, total // 200))
+
+
+@functools.lru_cache(maxsize=8192)
+def _make_contract(
+    symbol: str, sec_type: str, exchange: str, currency: str
+) -> Contract:
+    """
+    Build (once) the contract for a (symbol, sec_type, exchange, currency) tuple.
+
+    Pooled contracts are shared templates and must never be mutated; copy one
+    before qualifying it or filling in cached details.
+    """
+    if sec_type == "STK":
+        return Stock(symbol, exchange, currency)
+    else:
+        # For other security types, create generic contract
+        contract = Contract()
+        contract.symbol = symbol
+        contract.secType = sec_type
+        contract.exchange = exchange
+        contract.currency = currency
+        return contract
+
 
 class IBKRManager:
-    def __init__(self, host: str = "127.0.0.1", port: int = 7495, client_id: int = 1):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7495,
+        client_id: int = 1,
+        n_connections: int = 1,
+    ):
         """
         Initialize IBKR connection.
 
@@ -17,22 +117,42 @@ class IBKRManager:
             host: TWS/Gateway host (default: 127.0.0.1)
             port: TWS port (7495 for TWS, 4002 for Gateway)
             client_id: Unique client ID for this connection
+            n_connections: Number of API connections to open. Extra connections
+                use client IDs client_id+1, client_id+2, ... and are used to
+                qualify contracts in parallel
         """
-        self.ib = IB()
+        self.ibs = [IB() for _ in range(max(1, n_connections))]
+        self.ib = self.ibs[0]
         self.host = host
         self.port = port
         self.client_id = client_id
         self.connected = False
+        # Qualified contracts keyed by (symbol, sec_type, exchange, currency)
+        self._qual_cache: Dict[tuple, Contract] = {}
+        # Known qualification failures (same keys), mapped to when they failed
+        self._failed_cache: Dict[tuple, float] = {}
+        # Cache directories already merged into the caches above
+        self._loaded_cache_dirs = set()
 
     def connect(self) -> bool:
         """Connect to TWS/Gateway."""
         try:
             print(f"Connecting to IBKR TWS at {self.host}:{self.port}...")
-            self.ib.connect(self.host, self.port, clientId=self.client_id, timeout=20)
+            for i, ib in enumerate(self.ibs):
+                ib.connect(
+                    self.host, self.port, clientId=self.client_id + i, timeout=20
+                )
             self.connected = True
-            print("✅ Connected to IBKR TWS")
+            if len(self.ibs) > 1:
+                print(f"✅ Connected to IBKR TWS ({len(self.ibs)} connections)")
+            else:
+                print("✅ Connected to IBKR TWS")
             return True
         except Exception as e:
+            # Don't leave a partially opened pool behind
+            for ib in self.ibs:
+                if ib.isConnected():
+                    ib.disconnect()
             print(f"❌ Failed to connect to IBKR TWS: {e}")
             print("\nMake sure:")
             print("1. TWS or IB Gateway is running")
@@ -43,7 +163,8 @@ class IBKRManager:
     def disconnect(self):
         """Disconnect from TWS/Gateway."""
         if self.connected:
-            self.ib.disconnect()
+            for ib in self.ibs:
+                ib.disconnect()
             self.connected = False
             print("Disconnected from IBKR TWS")
 
@@ -57,6 +178,10 @@ class IBKRManager:
         """
         Create a contract for any security type.
 
+        Contracts are pooled: repeated calls with the same arguments return
+        the same unqualified Contract instance, so treat it as read-only and
+        copy it before changing any field.
+
         Args:
             symbol: Symbol/ticker
             sec_type: Security type (STK for stocks, OPT for options, etc.)
@@ -66,16 +191,7 @@ class IBKRManager:
         Returns:
             Contract object
         """
-        if sec_type == "STK":
-            return Stock(symbol, exchange, currency)
-        else:
-            # For other security types, create generic contract
-            contract = Contract()
-            contract.symbol = symbol
-            contract.secType = sec_type
-            contract.exchange = exchange
-            contract.currency = currency
-            return contract
+        return _make_contract(symbol, sec_type, exchange, currency)
 
     def qualify_contracts(
         self,
@@ -84,16 +200,22 @@ class IBKRManager:
         exchange: str = "SMART",
         currency: str = "USD",
         batch_size: int = 50,
+        cache_dir: Optional[Path] = None,
     ) -> Dict[str, Optional[Contract]]:
         """
         Qualify contracts to ensure they exist and get proper contract details.
 
+        Symbols already qualified in this session (or found in the contract
+        cache under cache_dir) are returned without contacting IBKR, as are
+        symbols that recently failed to qualify.
+
         Args:
             symbols: List of symbols/tickers
             sec_type: Security type (STK for stocks)
             exchange: Exchange
             currency: Currency
             batch_size: Number of contracts to process at once
+            cache_dir: Directory holding the persistent contract cache
 
         Returns:
             Dictionary mapping symbols to qualified contracts (None if not found)
@@ -101,66 +223,42 @@ class IBKRManager:
         if not self.connected:
             raise Exception("Not connected to IBKR TWS")
 
-        print(f"Qualifying {len(symbols)} contracts...")
+        if cache_dir is not None:
+            self._load_contract_cache(cache_dir)
 
-        contracts = []
-        symbol_map = {}
+        hits, misses = self._split_cached(symbols, sec_type, exchange, currency)
 
-        # Create contracts for all symbols
-        for i, symbol in enumerate(symbols):
-            contract = self.create_contract(symbol, sec_type, exchange, currency)
-            contracts.append(contract)
-            symbol_map[i] = symbol
+        # Pre-populate in input order; cache hits are filled in directly
+        qualified_contracts = dict.fromkeys(symbols)
+        qualified_contracts.update(hits)
+
+        print(f"Qualifying {len(misses)} contracts ({len(hits)} cached)...")
 
         # Qualify contracts in batches
-        qualified_contracts = {}
-
-        with tqdm(total=len(contracts), desc="Qualifying contracts") as pbar:
-            for i in range(0, len(contracts), batch_size):
-                batch = contracts[i : i + batch_size]
-
-                try:
-                    # Qualify the batch
-                    qualified_batch = self.ib.qualifyContracts(*batch)
-
-                    # Process results
-                    for j, original_contract in enumerate(batch):
-                        contract_index = i + j  # Calculate the original index
-                        symbol = symbol_map[contract_index]
-
-                        # Find the qualified contract for this symbol
-                        qualified = None
-                        for q_contract in qualified_batch:
-                            if (
-                                q_contract.symbol == original_contract.symbol
-                                and q_contract.currency == original_contract.currency
-                                and q_contract.secType == original_contract.secType
-                            ):
-                                qualified = q_contract
-                                break
-
-                        qualified_contracts[symbol] = qualified
-
-                        if qualified:
-                            pbar.set_description(f"✅ {symbol}")
-                        else:
-                            pbar.set_description(f"❌ {symbol}")
-
-                        pbar.update(1)
-
-                    # Rate limiting
-                    time.sleep(0.1)
-
-                except Exception as e:
-                    print(f"Error qualifying batch: {e}")
-                    # Mark all in this batch as failed
-                    for j, contract in enumerate(batch):
-                        contract_index = i + j  # Calculate the original index
-                        symbol = symbol_map[contract_index]
-                        qualified_contracts[symbol] = None
-                        pbar.update(1)
-
-        successful = len([c for c in qualified_contracts.values() if c is not None])
+        if misses:
+            with _progress_bar(len(misses), "Qualifying contracts") as pbar:
+                batch_results = self.ib.run(
+                    self._qualify_async(
+                        misses, sec_type, exchange, currency, batch_size, pbar
+                    )
+                )
+
+            now = time.time()
+            for batch_result, errored in batch_results:
+                for symbol, contract in batch_result:
+                    qualified_contracts[symbol] = contract
+                    key = (symbol, sec_type, exchange, currency)
+                    if contract is not None:
+                        self._qual_cache[key] = contract
+                        self._failed_cache.pop(key, None)
+                    elif not errored:
+                        # IBKR answered but found nothing: remember the miss
+                        self._failed_cache[key] = now
+
+            if cache_dir is not None:
+                self._save_contract_cache(cache_dir)
+
+        successful = sum(1 for c in qualified_contracts.values() if c is not None)
         failed = len(qualified_contracts) - successful
 
         print("\nQualification complete:")
@@ -169,6 +267,233 @@ class IBKRManager:
 
         return qualified_contracts
 
+    def _split_cached(
+        self, symbols: List[str], sec_type: str, exchange: str, currency: str
+    ) -> Tuple[Dict[str, Optional[Contract]], List[str]]:
+        """
+        Split symbols into cache hits and symbols that still need qualifying.
+
+        Returns:
+            (hits, misses) where hits maps symbols to their cached contract, or
+            to None for recent known failures, and misses lists unique symbols
+            in input order
+        """
+        hits = {}
+        misses = []
+        expiry = time.time() - FAILED_CONTRACT_TTL
+
+        for symbol in dict.fromkeys(symbols):
+            key = (symbol, sec_type, exchange, currency)
+            cached = self._qual_cache.get(key)
+            if cached is not None:
+                hits[symbol] = cached
+            elif self._failed_cache.get(key, 0) > expiry:
+                hits[symbol] = None
+            else:
+                misses.append(symbol)
+
+        return hits, misses
+
+    def _load_contract_cache(self, cache_dir: Path):
+        """Merge contracts persisted under cache_dir into the session cache."""
+        if cache_dir in self._loaded_cache_dirs:
+            return
+        self._loaded_cache_dirs.add(cache_dir)
+
+        cache_file = cache_dir / CONTRACT_CACHE_FILE
+        if not cache_file.exists():
+            return
+
+        try:
+            entries = _load_json(cache_file)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable contract cache {cache_file}: {e}")
+            return
+
+        expiry = time.time() - FAILED_CONTRACT_TTL
+
+        for entry in entries.values():
+            key = (
+                entry["symbol"],
+                entry["sec_type"],
+                entry["exchange"],
+                entry["currency"],
+            )
+            if key in self._qual_cache or key in self._failed_cache:
+                continue
+
+            # conId 0 marks a symbol IBKR could not qualify
+            if not entry["conId"]:
+                if entry["cached_at"] > expiry:
+                    self._failed_cache[key] = entry["cached_at"]
+                continue
+
+            contract = copy.copy(self.create_contract(*key))
+            contract.conId = entry["conId"]
+            contract.primaryExchange = entry["primaryExchange"]
+            self._qual_cache[key] = contract
+
+    def _save_contract_cache(self, cache_dir: Path):
+        """Atomically persist the session's contract cache under cache_dir."""
+        cache_dir.mkdir(exist_ok=True)
+
+        now = time.time()
+        entries = {}
+
+        for key, contract in self._qual_cache.items():
+            entries["|".join(key)] = self._cache_entry(
+                key, contract.conId, contract.primaryExchange, now
+            )
+
+        for key, failed_at in self._failed_cache.items():
+            entries["|".join(key)] = self._cache_entry(key, 0, "", failed_at)
+
+        # Write to a temporary file first so a crash never leaves a torn cache
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            f.write(_dump_json(entries))
+        os.replace(f.name, cache_dir / CONTRACT_CACHE_FILE)
+
+    @staticmethod
+    def _cache_entry(
+        key: tuple, con_id: int, primary_exchange: str, cached_at: float
+    ) -> Dict[str, any]:
+        """Build the on-disk representation of one contract cache entry."""
+        symbol, sec_type, exchange, currency = key
+        return {
+            "symbol": symbol,
+            "sec_type": sec_type,
+            "exchange": exchange,
+            "currency": currency,
+            "conId": con_id,
+            "primaryExchange": primary_exchange,
+            "cached_at": cached_at,
+        }
+
+    async def _qualify_async(
+        self,
+        symbols: List[str],
+        sec_type: str,
+        exchange: str,
+        currency: str,
+        batch_size: int,
+        pbar: tqdm,
+    ) -> List[Tuple[List[tuple], bool]]:
+        """Qualify all batches concurrently, sharding them across connections."""
+        batches = [
+            symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)
+        ]
+        counts = {"ok": 0, "fail": 0}
+
+        # Deal batches round-robin; each connection works through its own shard
+        n = len(self.ibs)
+        shard_results = await asyncio.gather(
+            *[
+                self._qualify_on(
+                    ib, batches[k::n], sec_type, exchange, currency, pbar, counts
+                )
+                for k, ib in enumerate(self.ibs)
+            ]
+        )
+        return [result for shard in shard_results for result in shard]
+
+    async def _qualify_on(
+        self,
+        ib: IB,
+        batches: List[List[str]],
+        sec_type: str,
+        exchange: str,
+        currency: str,
+        pbar: tqdm,
+        counts: Dict[str, int],
+    ) -> List[Tuple[List[tuple], bool]]:
+        """Qualify a shard of batches over a single connection."""
+        sem = asyncio.Semaphore(QUALIFY_CONCURRENCY)
+        return await asyncio.gather(
+            *[
+                self._qualify_batch(
+                    ib, batch, sec_type, exchange, currency, sem, pbar, counts
+                )
+                for batch in batches
+            ]
+        )
+
+    async def _qualify_batch(
+        self,
+        ib: IB,
+        batch_symbols: List[str],
+        sec_type: str,
+        exchange: str,
+        currency: str,
+        sem: asyncio.Semaphore,
+        pbar: tqdm,
+        counts: Dict[str, int],
+    ) -> Tuple[List[tuple], bool]:
+        """
+        Qualify one batch of symbols.
+
+        Returns:
+            (symbol, contract) pairs for the batch, and whether the request
+            itself failed (in which case every contract is None)
+        """
+        results = []
+
+        try:
+            async with sem:
+                # Create the batch only once it is about to be sent; qualifying
+                # fills contracts in place, so send copies of the pooled ones
+                batch = [
+                    copy.copy(
+                        self.create_contract(symbol, sec_type, exchange, currency)
+                    )
+                    for symbol in batch_symbols
+                ]
+
+                # Qualify the batch
+                qualified_batch = await ib.qualifyContractsAsync(*batch)
+        except Exception as e:
+            print(f"Error qualifying batch: {e}")
+            # Mark all in this batch as failed
+            results = [(symbol, None) for symbol in batch_symbols]
+            counts["fail"] += len(batch_symbols)
+            pbar.set_postfix_str(f"ok={counts['ok']} fail={counts['fail']}", False)
+            pbar.update(len(batch_symbols))
+            return results, True
+
+        # Index qualified contracts once instead of scanning per original
+        lut = {(q.symbol, q.currency, q.secType): q for q in qualified_batch if q.conId}
+
+        # Process results
+        for symbol, original_contract in zip(batch_symbols, batch):
+            # Find the qualified contract for this symbol
+            qualified = lut.get(
+                (
+                    original_contract.symbol,
+                    original_contract.currency,
+                    original_contract.secType,
+                )
+            )
+
+            results.append((symbol, qualified))
+
+            if qualified:
+                counts["ok"] += 1
+            else:
+                counts["fail"] += 1
+
+        # Refresh the progress bar once per batch rather than per contract
+        pbar.set_postfix_str(f"ok={counts['ok']} fail={counts['fail']}", False)
+        pbar.update(len(batch_symbols))
+
+        return results, False
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _safe_name(name: str) -> str:
+        """Turn a watchlist name into the stem used for its output files."""
+        return name.lower().translate(_SAFE_NAME_TABLE)
+
     def create_tws_importable_watchlist(
         self, contracts: List[Contract], watchlist_name: str, output_dir: Path
     ) -> str:
@@ -183,31 +508,31 @@ class IBKRManager:
         Returns:
             Path to the created CSV file
         """
-        # Create TWS-compatible CSV format
-        csv_data = []
-
-        for contract in contracts:
-            # TWS import format: Symbol,Exchange,Currency,SecType
-            csv_data.append(
-                {
-                    "Symbol": contract.symbol,
-                    "Exchange": contract.primaryExchange or contract.exchange,
-                    "Currency": contract.currency,
-                    "SecType": contract.secType,
-                }
+        csv_file = f"{output_dir / self._safe_name(watchlist_name)}_tws_import.csv"
+
+        # Stream rows straight to disk in TWS import format:
+        # Symbol,Exchange,Currency,SecType
+        with open(csv_file, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("Symbol", "Exchange", "Currency", "SecType"))
+            writer.writerows(
+                (
+                    contract.symbol,
+                    contract.primaryExchange or contract.exchange,
+                    contract.currency,
+                    contract.secType,
+                )
+                for contract in contracts
             )
 
-        # Save to CSV
-        df = pd.DataFrame(csv_data)
-        csv_file = (
-            output_dir / f"{watchlist_name.lower().replace(' ', '_')}_tws_import.csv"
-        )
-        df.to_csv(csv_file, index=False)
-
-        return str(csv_file)
+        return csv_file
 
     def add_contracts_to_tws(
-        self, contracts: List[Contract], request_market_data: bool = True
+        self,
+        contracts: List[Contract],
+        request_market_data: bool = True,
+        use_async: bool = True,
+        tick_timeout: float = 5.0,
     ) -> int:
         """
         Add contracts to TWS for monitoring.
@@ -215,6 +540,10 @@ class IBKRManager:
         Args:
             contracts: List of qualified contracts
             request_market_data: Whether to request market data (adds to TWS watchlist)
+            use_async: Pipeline requests on the ib_insync event loop instead of
+                submitting them one at a time
+            tick_timeout: Seconds to wait for the first tick of each contract
+                before counting it as done (async mode only)
 
         Returns:
             Number of contracts successfully added
@@ -222,32 +551,93 @@ class IBKRManager:
         if not self.connected:
             raise Exception("Not connected to IBKR TWS")
 
-        successful_count = 0
-
         print(f"Adding {len(contracts)} contracts to TWS...")
 
-        with tqdm(total=len(contracts), desc="Adding contracts") as pbar:
-            for contract in contracts:
-                try:
-                    if request_market_data:
-                        # Request market data (this adds the contract to TWS)
-                        self.ib.reqMktData(contract)
+        with _progress_bar(len(contracts), "Adding contracts") as pbar:
+            if use_async and request_market_data:
+                results = self.ib.run(
+                    self._add_contracts_async(contracts, pbar, tick_timeout)
+                )
+                successful_count = sum(results)
+            else:
+                successful_count = self._add_contracts_sync(
+                    contracts, request_market_data, pbar
+                )
+
+        print(
+            f"✅ Successfully added {successful_count}/{len(contracts)} contracts to TWS"
+        )
+        return successful_count
+
+    async def _add_contracts_async(
+        self, contracts: List[Contract], pbar: tqdm, tick_timeout: float
+    ) -> List[bool]:
+        """Submit all market data requests concurrently, paced to the API limit."""
+        pacer = _TokenBucket(API_RATE_LIMIT)
+        return await asyncio.gather(
+            *[
+                self._req_one(contract, pacer, pbar, tick_timeout)
+                for contract in contracts
+            ]
+        )
+
+    async def _req_one(
+        self,
+        contract: Contract,
+        pacer: _TokenBucket,
+        pbar: tqdm,
+        tick_timeout: float,
+    ) -> bool:
+        """Request market data for one contract and wait for its first tick."""
+        await pacer.acquire()
+        try:
+            # Request market data (this adds the contract to TWS)
+            ticker = self.ib.reqMktData(contract, "", False, False)
+        except Exception as e:
+            print(f"Warning: Could not add {contract.symbol}: {e}")
+            pbar.update(1)
+            return False
+
+        done = asyncio.get_running_loop().create_future()
+
+        def on_update(_ticker):
+            if not done.done():
+                done.set_result(True)
+                pbar.update(1)
+
+        ticker.updateEvent += on_update
+        try:
+            await asyncio.wait_for(done, tick_timeout)
+        except asyncio.TimeoutError:
+            # No ticks yet (e.g. market closed); the subscription is still live
+            pbar.update(1)
+        finally:
+            ticker.updateEvent -= on_update
+
+        return True
+
+    def _add_contracts_sync(
+        self, contracts: List[Contract], request_market_data: bool, pbar: tqdm
+    ) -> int:
+        """Add contracts one at a time using the blocking API."""
+        successful_count = 0
 
-                    successful_count += 1
-                    pbar.set_description(f"✅ {contract.symbol}")
+        for contract in contracts:
+            try:
+                if request_market_data:
+                    # Request market data (this adds the contract to TWS)
+                    self.ib.reqMktData(contract)
 
                     # Small delay to avoid rate limits
                     time.sleep(0.05)
 
-                except Exception as e:
-                    pbar.set_description(f"❌ {contract.symbol}")
-                    print(f"Warning: Could not add {contract.symbol}: {e}")
+                successful_count += 1
 
-                pbar.update(1)
+            except Exception as e:
+                print(f"Warning: Could not add {contract.symbol}: {e}")
+
+            pbar.update(1)
 
-        print(
-            f"✅ Successfully added {successful_count}/{len(contracts)} contracts to TWS"
-        )
         return successful_count
 
     def create_watchlist_from_symbols(
@@ -280,17 +670,33 @@ class IBKRManager:
 
         print(f"Creating watchlist '{watchlist_name}' with {len(symbols)} symbols...")
 
-        # Qualify contracts
+        # Qualify contracts; cached symbols are served without contacting IBKR
         qualified_contracts = self.qualify_contracts(
-            symbols, sec_type, exchange, currency
+            symbols,
+            sec_type,
+            exchange,
+            currency,
+            cache_dir=output_dir or Path("./data"),
         )
 
-        # Get only successfully qualified contracts
-        valid_contracts = [
-            contract
-            for contract in qualified_contracts.values()
-            if contract is not None
-        ]
+        # Split qualified contracts into valid contracts, result rows and
+        # failures in a single pass
+        valid_contracts, successful_contracts, failed_symbols = [], [], []
+        for symbol, contract in qualified_contracts.items():
+            if contract is None:
+                failed_symbols.append(symbol)
+            else:
+                valid_contracts.append(contract)
+                successful_contracts.append(
+                    {
+                        "symbol": symbol,
+                        "contract_symbol": contract.symbol,
+                        "exchange": contract.primaryExchange or contract.exchange,
+                        "currency": contract.currency,
+                        "contract_id": contract.conId,
+                        "sec_type": contract.secType,
+                    }
+                )
 
         if not valid_contracts:
             print("❌ No valid contracts found. Cannot create watchlist.")
@@ -315,26 +721,11 @@ class IBKRManager:
             "watchlist_name": watchlist_name,
             "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
             "total_symbols": len(symbols),
-            "successful_contracts": [],
-            "failed_symbols": [],
+            "successful_contracts": successful_contracts,
+            "failed_symbols": failed_symbols,
             "tws_import_file": csv_file,
         }
 
-        for symbol, contract in qualified_contracts.items():
-            if contract:
-                results["successful_contracts"].append(
-                    {
-                        "symbol": symbol,
-                        "contract_symbol": contract.symbol,
-                        "exchange": contract.primaryExchange or contract.exchange,
-                        "currency": contract.currency,
-                        "contract_id": contract.conId,
-                        "sec_type": contract.secType,
-                    }
-                )
-            else:
-                results["failed_symbols"].append(symbol)
-
         # Save results if requested
         if save_results:
             self.save_watchlist_results(results, output_dir)
@@ -361,31 +752,51 @@ class IBKRManager:
         output_dir.mkdir(exist_ok=True)
 
         watchlist_name = results["watchlist_name"]
-        safe_name = watchlist_name.lower().replace(" ", "_").replace("-", "_")
-
-        # Save complete results to JSON
-        results_file = output_dir / f"watchlist_{safe_name}_results.json"
-        with open(results_file, "w") as f:
-            json.dump(results, f, indent=2)
-
-        # Save successful contracts to CSV
-        if results["successful_contracts"]:
-            df = pd.DataFrame(results["successful_contracts"])
-            csv_file = output_dir / f"watchlist_{safe_name}_contracts.csv"
-            df.to_csv(csv_file, index=False)
-
-        # Save failed symbols to text file
-        if results["failed_symbols"]:
-            failed_file = output_dir / f"watchlist_{safe_name}_failed.txt"
+        safe_name = self._safe_name(watchlist_name)
+
+        # Derive every output path from one shared prefix
+        prefix = str(output_dir / f"watchlist_{safe_name}")
+        results_file = Path(f"{prefix}_results.json")
+        csv_file = (
+            Path(f"{prefix}_contracts.csv") if results["successful_contracts"] else None
+        )
+        failed_file = (
+            Path(f"{prefix}_failed.txt") if results["failed_symbols"] else None
+        )
+
+        def _write_json():
+            # Save complete results to JSON
+            results_file.write_bytes(_dump_json(results))
+
+        def _write_csv():
+            # Save successful contracts to CSV
+            rows = results["successful_contracts"]
+            with open(csv_file, "w", newline="") as f:
+                writer = csv.DictWriter(f, list(rows[0]), lineterminator="\n")
+                writer.writeheader()
+                writer.writerows(rows)
+
+        def _write_failed():
+            # Save failed symbols to text file
             with open(failed_file, "w") as f:
                 for symbol in results["failed_symbols"]:
                     f.write(f"{symbol}\n")
 
+        writers = [_write_json]
+        if csv_file:
+            writers.append(_write_csv)
+        if failed_file:
+            writers.append(_write_failed)
+
+        # The files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            list(executor.map(lambda write: write(), writers))
+
         print(f"\nResults saved to {output_dir}:")
         print(f"  📄 Complete results: {results_file}")
-        if results["successful_contracts"]:
+        if csv_file:
             print(f"  📊 Contracts CSV: {csv_file}")
-        if results["failed_symbols"]:
+        if failed_file:
             print(f"  ❌ Failed symbols: {failed_file}")
         if results.get("tws_import_file"):
             print(f"  🎯 TWS Import File: {results['tws_import_file']}")
@@ -399,7 +810,7 @@ class IBKRManager:
             file_path: Path to file containing symbols
 
         Returns:
-            List of unique symbols
+            List of unique symbols, in the order they first appear
         """
         file_path = Path(file_path)
         symbols = []
@@ -408,23 +819,26 @@ class IBKRManager:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         if file_path.suffix.lower() == ".json":
-            with open(file_path) as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Assume it's a mapping, get non-null values
-                    symbols = [
-                        str(ticker) for ticker in data.values() if ticker is not None
-                    ]
-                elif isinstance(data, list):
-                    symbols = [str(item) for item in data if item is not None]
+            data = _load_json(file_path)
+            if isinstance(data, dict):
+                # Assume it's a mapping, get non-null values
+                symbols = [
+                    str(ticker) for ticker in data.values() if ticker is not None
+                ]
+            elif isinstance(data, list):
+                symbols = [str(item) for item in data if item is not None]
 
         elif file_path.suffix.lower() == ".csv":
-            df = pd.read_csv(file_path)
-            # Look for common column names
-            for col_name in ["Ticker", "ticker", "Symbol", "symbol"]:
-                if col_name in df.columns:
-                    symbols = df[col_name].dropna().astype(str).tolist()
+            # Read just the header with the same parser usecols relies on, so
+            # encodings and BOMs resolve to the same column names
+            header = pd.read_csv(file_path, nrows=0).columns
 
+            # Look for common column names and read only that column
+            for col_name in ["Ticker", "ticker", "Symbol", "symbol"]:
+                if col_name in header:
+                    symbols = pd.read_csv(
+                        file_path, usecols=[col_name], dtype="string"
+                    )[col_name].dropna()
                     break
 
         elif file_path.suffix.lower() == ".txt":
@@ -434,16 +848,26 @@ class IBKRManager:
         else:
             raise ValueError(f"Unsupported file format: {file_path.suffix}")
 
-        # Remove duplicates and empty strings, then sort
-        symbols = sorted(list(set([s for s in symbols if s and s.strip()])))
-        symbols = [s.split(".")[0] for s in symbols]
+        # Strip exchange suffixes and remove duplicates and empty strings,
+        # keeping first-seen order
+        seen = {}
+        for s in symbols:
+            if s and (s := s.strip()):
+                k = s.split(".", 1)[0]
+                if k:
+                    seen.setdefault(k, None)
+        symbols = list(seen)
         print(f"Loaded {len(symbols)} unique symbols from {file_path}")
         return symbols
 
-    def test_connection(self) -> bool:
+    def test_connection(self, deep: bool = False) -> bool:
         """
         Test the connection and basic functionality.
 
+        Args:
+            deep: Also qualify a test contract (AAPL) instead of only pinging
+                the server for its current time
+
         Returns:
             True if connection test passes, False otherwise
         """
@@ -452,10 +876,21 @@ class IBKRManager:
                 return False
 
         try:
+            if not deep:
+                server_time = self.ib.reqCurrentTime()
+                if server_time is not None:
+                    print(f"✅ Connection test successful! Server time: {server_time}")
+                    return True
+                else:
+                    print("❌ Connection test failed - no server time received")
+                    return False
+
+            # Qualify directly; qualify_contracts would answer from its caches
+            # without ever contacting IBKR
             print("Testing contract qualification with AAPL...")
-            test_contracts = self.qualify_contracts(["AAPL"])
+            qualified = self.ib.qualifyContracts(Stock("AAPL", "SMART", "USD"))
 
-            if test_contracts.get("AAPL"):
+            if qualified and qualified[0].conId:
                 print("✅ Connection test successful!")
                 return True
             else:
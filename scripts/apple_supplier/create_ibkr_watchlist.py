@@ -23,11 +23,7 @@ def main():
         data_dir / "apple_supplier_tickers.csv",
     ]
 
-    ticker_file = None
-    for file_path in ticker_files:
-        if file_path.exists():
-            ticker_file = file_path
-            break
+    ticker_file = next((p for p in ticker_files if p.exists()), None)
 
     if not ticker_file:
         print("❌ No ticker files found!")
@@ -4,14 +4,18 @@ Apple Supplier List Parser
 Downloads and parses Apple's supplier list PDF to extract company names and find their stock tickers.
 """
 
-import io
+import functools
 import json
+import os
 import re
+import shutil
+import sys
+import tempfile
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import pdfplumber
@@ -19,6 +23,210 @@ import requests
 from tqdm import tqdm
 from yahooquery import search
 
+try:
+    import hyperscan
+except ImportError:  # Optional speedup; fall back to the re module
+    hyperscan = None
+
+try:
+    import pymupdf
+except ImportError:  # Optional speedup; fall back to pdfplumber
+    pymupdf = None
+
+# Yahoo search results are cached here across runs, keyed by lowercased term
+SEARCH_CACHE_FILE = Path.home() / ".cache" / "apple_suppliers" / "yq.json"
+SEARCH_CACHE_TTL = 90 * 24 * 3600
+
+# Yahoo search throttling: sustained requests per second, and retries with
+# exponential backoff when Yahoo answers with a (non-JSON) rate-limit page
+SEARCH_RATE_LIMIT = 20
+SEARCH_MAX_RETRIES = 5
+SEARCH_BACKOFF_BASE = 1.0
+
+# PDF parser used for table extraction: "pymupdf" (much faster, used by
+# default when installed) or "pdfplumber". Override with PDF_BACKEND.
+PDF_BACKEND = os.environ.get(
+    "PDF_BACKEND", "pymupdf" if pymupdf is not None else "pdfplumber"
+).lower()
+if PDF_BACKEND == "pymupdf" and pymupdf is None:
+    PDF_BACKEND = "pdfplumber"
+
+# Cells matching any of these are headers, footers or other PDF noise
+_SKIP_PATTERNS = [
+    r"^page \d+",
+    r"^www\.",
+    r"@.*\.",
+    r"©",
+    r"fiscal year",
+    r"trademarks",
+    r"apple inc\.",
+    r"^[A-Z]{2,3}$",  # Country codes
+    r"^\d{4}$",  # Just years
+]
+
+# Text starting with any of these is not a company name
+_NON_COMPANY_PATTERNS = [
+    r"^\d+$",  # Just numbers (but not alphanumeric like 3M)
+    r"^Page \d+",  # Page numbers
+    r"^www\.",  # URLs
+    r"@.*\.",  # Email addresses
+    r"^Manufacturing Site",  # Headers
+    r"^fiscal",  # Headers
+    r"^trademark",  # Headers
+    r"^Company Name",  # Headers
+    r"^Apple Inc",  # Apple references
+    r"^List",  # Apple references
+    r"©",  # Copyright
+    r"^\d{1,2}/\d{1,2}/\d{4}$",  # Dates
+    r"^[A-Z][a-z]+,\s[A-Z]{2}$",  # City, State format
+    r"^[A-Z]{2}$",  # Two letter country codes (but not companies like HP)
+]
+
+# Positive indicators for company names
+_COMPANY_INDICATORS = [
+    r".*(?:Corp|Corporation|Inc|Incorporated|Ltd|Limited|Co\.|Company|LLC|Group|Holdings|Technologies|Systems|Solutions|Industries|Manufacturing|Electronics|Semiconductor).*",
+    r".*(?:Precision|Micro|Tech|Electric|Digital|Global|International|Advanced|Automotive|Industrial).*",
+]
+
+
+def _compile_any(patterns: List[str]) -> re.Pattern:
+    """Fuse patterns into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+class _PatternSet:
+    """
+    Case-insensitive multi-pattern matcher.
+
+    Uses a single Hyperscan DFA scan when hyperscan is installed, otherwise
+    the fused Python regex. With anchored=True patterns must match at the
+    start of the text (re.match semantics), otherwise anywhere (re.search).
+    """
+
+    def __init__(self, patterns: List[str], anchored: bool = False):
+        self.anchored = anchored
+        self.regex = _compile_any(patterns)
+        self._db = None
+
+        if hyperscan is not None:
+            # Hyperscan always searches, so anchor explicitly where needed
+            expressions = [(f"^(?:{p})" if anchored else p).encode() for p in patterns]
+            flags = (
+                hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_UTF8
+                | hyperscan.HS_FLAG_UCP
+                | hyperscan.HS_FLAG_SINGLEMATCH
+            )
+            self._db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self._db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions),
+            )
+
+    def matches(self, text: str) -> bool:
+        """Return True if any pattern matches text."""
+        if self._db is None:
+            if self.anchored:
+                return self.regex.match(text) is not None
+            return self.regex.search(text) is not None
+
+        found = False
+
+        def on_match(pattern_id, start, end, flags, context):
+            nonlocal found
+            found = True
+            return True  # Stop at the first match
+
+        try:
+            self._db.scan(text.encode(), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        return found
+
+
+# Regexes are compiled once here rather than on every cell
+_SKIP_RE = _compile_any(_SKIP_PATTERNS)
+_NON_COMPANY_PATTERN_SET = _PatternSet(_NON_COMPANY_PATTERNS, anchored=True)
+_COMPANY_INDICATOR_PATTERN_SET = _PatternSet(_COMPANY_INDICATORS, anchored=True)
+_VALID_NAME_RE = re.compile(r"^[A-Z0-9][A-Za-z0-9\s&\-\.\,\(\)]*$")
+_HAS_LETTER_RE = re.compile(r"[A-Za-z]")
+_HAS_DIGIT_RE = re.compile(r"[0-9]")
+_WS_RE = re.compile(r"\s+")
+_LEADING_NUMBER_RE = re.compile(r"^\d+\s+")
+# Common corporate suffixes stripped to build a shorter search term
+_SUFFIX_RE = re.compile(
+    r"\b(Corp|Corporation|Inc|Incorporated|Ltd|Limited|Co\.|Company|LLC|Group|Holdings|Technologies|Tech|Systems|Solutions|Industries|Manufacturing|Electronics|Semiconductor)\b",
+    re.IGNORECASE,
+)
+
+# Special cases for known short company names
+_KNOWN_SHORT_COMPANIES = frozenset(
+    ["3M", "HP", "LG", "SK", "AT&T", "IBM", "AMD", "ARM"]
+)
+
+
+def _open_pdf(pdf_path: str):
+    """Open a PDF file with the configured backend."""
+    if PDF_BACKEND == "pymupdf":
+        return pymupdf.open(pdf_path)
+    return pdfplumber.open(pdf_path)
+
+
+def _page_count(pdf) -> int:
+    """Number of pages in a document opened by _open_pdf."""
+    if PDF_BACKEND == "pymupdf":
+        return pdf.page_count
+    return len(pdf.pages)
+
+
+def _page_tables(pdf, page_index: int) -> list:
+    """Extract the tables on one page as lists of rows of cell strings."""
+    if PDF_BACKEND == "pymupdf":
+        return [table.extract() for table in pdf[page_index].find_tables().tables]
+    return pdf.pages[page_index].extract_tables()
+
+
+# PDF opened once per worker process by _init_pdf_worker
+_worker_pdf = None
+
+
+def _init_pdf_worker(pdf_path: str):
+    """Open the downloaded PDF in a page-extraction worker process."""
+    global _worker_pdf
+    _worker_pdf = _open_pdf(pdf_path)
+
+
+def _extract_tables_from_page(page_index: int) -> Tuple[int, list]:
+    """Extract all tables from one page of the worker's PDF."""
+    return page_index, _page_tables(_worker_pdf, page_index)
+
+
+class RateLimiter:
+    """Thread-safe token bucket, refilled from elapsed time on each acquire."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available and consume it."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) / self.rate)
+
 
 class AppleSupplierParser:
     def __init__(self):
@@ -26,83 +234,48 @@ class AppleSupplierParser:
         self.suppliers = []
         self.tickers = {}
         self.progress_lock = threading.Lock()
+        self.search_cache = self.load_search_cache()
+        self.search_cache_lock = threading.Lock()
+        self.rate_limiter = RateLimiter(SEARCH_RATE_LIMIT)
 
     def download_and_parse_pdf(self) -> List[str]:
-        """Download PDF into memory and extract supplier company names."""
-        suppliers = []
-
+        """Download PDF to a temporary file and extract supplier company names."""
+        pdf_path = None
         try:
             print("Downloading and parsing Apple supplier list PDF...")
 
-            # Download PDF into memory
-            response = requests.get(self.pdf_url)
-            response.raise_for_status()
-
-            # Create a BytesIO object from the PDF content
-            pdf_buffer = io.BytesIO(response.content)
-
-            with pdfplumber.open(pdf_buffer) as pdf:
-                print(f"Processing {len(pdf.pages)} pages...")
-
-                for page_num, page in enumerate(pdf.pages, 1):
-                    print(f"  Extracting tables from page {page_num}")
-
-                    # Extract tables from the page
-                    tables = page.extract_tables()
-
-                    if tables:
-                        for table_num, table in enumerate(tables):
-                            print(
-                                f"    Found table {table_num + 1} with {len(table)} rows"
-                            )
-
-                            for row in table:
-                                if row:  # Skip empty rows
-                                    for cell in row:
-                                        if cell and isinstance(cell, str):
-                                            cell = cell.strip()
-
-                                            # Skip empty cells and obvious non-company entries
-                                            if (
-                                                not cell
-                                                or not self.is_likely_company_name(cell)
-                                            ):
-                                                continue
-
-                                            skip_patterns = [
-                                                r"^page \d+",
-                                                r"^www\.",
-                                                r"@.*\.",
-                                                r"©",
-                                                r"fiscal year",
-                                                r"trademarks",
-                                                r"apple inc\.",
-                                                r"^[A-Z]{2,3}$",  # Country codes
-                                                r"^\d{4}$",  # Just years
-                                            ]
-
-                                            # Check if it contains long descriptive text (likely headers/footers)
-                                            if (
-                                                len(cell.split()) > 10
-                                            ):  # More than 10 words is likely descriptive text
-                                                continue
-
-                                            # Check patterns
-                                            if any(
-                                                re.search(pattern, cell, re.IGNORECASE)
-                                                for pattern in skip_patterns
-                                            ):
-                                                continue
-
-                                            # Check if this looks like a company name
-                                            if self.is_likely_company_name(cell):
-                                                clean_name = self.clean_company_name(
-                                                    cell
-                                                )
-                                                suppliers.append(clean_name)
-
-            # Remove duplicates while preserving order
-            suppliers = list(dict.fromkeys(suppliers))
+            # Stream the PDF to disk in chunks rather than holding it in memory;
+            # the parsers and each worker then read it straight from the file
+            with requests.get(self.pdf_url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                    pdf_path = f.name
+                    shutil.copyfileobj(response.raw, f, length=65536)
+
+            with _open_pdf(pdf_path) as pdf:
+                page_count = _page_count(pdf)
+
+            print(f"Processing {page_count} pages with {PDF_BACKEND}...")
+
+            # Table extraction dominates parsing time and pages are independent,
+            # so extract them in parallel; each worker opens the PDF once
+            page_tables = [None] * page_count
+            with ProcessPoolExecutor(
+                max_workers=max(1, min(os.cpu_count() or 1, page_count)),
+                initializer=_init_pdf_worker,
+                initargs=(pdf_path,),
+            ) as executor:
+                futures = [
+                    executor.submit(_extract_tables_from_page, page_index)
+                    for page_index in range(page_count)
+                ]
+                for future in as_completed(futures):
+                    page_index, tables = future.result()
+                    print(f"  Extracted tables from page {page_index + 1}")
+                    page_tables[page_index] = tables
+
+            suppliers = self.extract_suppliers_from_tables(page_tables)
 
             print(f"Extracted {len(suppliers)} potential supplier names")
             return suppliers
@@ -111,59 +284,90 @@ class AppleSupplierParser:
             print(f"Error downloading or parsing PDF: {e}")
             return []
 
-    def is_likely_company_name(self, text: str) -> bool:
+        finally:
+            if pdf_path is not None:
+                os.unlink(pdf_path)
+
+    def extract_suppliers_from_tables(self, page_tables: List[list]) -> List[str]:
+        """Extract supplier company names from per-page lists of tables."""
+        cells = []
+        for page_num, tables in enumerate(page_tables, 1):
+            for table_num, table in enumerate(tables or []):
+                print(
+                    f"    Page {page_num}: table {table_num + 1} "
+                    f"with {len(table)} rows"
+                )
+                cells.extend(
+                    cell
+                    for row in table
+                    if row  # Skip empty rows
+                    for cell in row
+                    if cell and isinstance(cell, str)
+                )
+
+        if not cells:
+            return []
+
+        # Run the cheap checks column-wise over every cell at once, so only
+        # the survivors reach the per-cell company-name checks
+        cells = pd.Series(cells, dtype="string").str.strip()
+        candidates = cells[
+            # Skip empty cells
+            (cells != "")
+            # More than 10 words is likely descriptive text (headers/footers)
+            & (cells.str.split().str.len() <= 10)
+            # Check patterns
+            & ~cells.str.contains(_SKIP_RE)
+        ]
+
+        # Remove duplicates as they are found, preserving order
+        seen = set()
+        suppliers = []
+        for cell in candidates:
+            # PDF tables repeat the same short strings many times; interned
+            # cells make the memoized predicate lookups below cheap
+            cell = sys.intern(cell)
+
+            # Check if this looks like a company name
+            if not self.is_likely_company_name(cell):
+                continue
+
+            clean_name = self.clean_company_name(cell)
+            if clean_name in seen:
+                continue
+            seen.add(clean_name)
+            suppliers.append(clean_name)
+
+        return suppliers
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def is_likely_company_name(text: str) -> bool:
         """Check if a text string is likely to be a company name."""
         if not text or len(text.strip()) < 1:
             return False
 
         text = text.strip()
 
-        # Special cases for known short company names
-        known_short_companies = ["3M", "HP", "LG", "SK", "AT&T", "IBM", "AMD", "ARM"]
-        if text in known_short_companies:
+        if text in _KNOWN_SHORT_COMPANIES:
             return True
 
         # Skip obvious non-company patterns
-        non_company_patterns = [
-            r"^\d+$",  # Just numbers (but not alphanumeric like 3M)
-            r"^Page \d+",  # Page numbers
-            r"^www\.",  # URLs
-            r"@.*\.",  # Email addresses
-            r"^Manufacturing Site",  # Headers
-            r"^fiscal",  # Headers
-            r"^trademark",  # Headers
-            r"^Company Name",  # Headers
-            r"^Apple Inc",  # Apple references
-            r"^List",  # Apple references
-            r"©",  # Copyright
-            r"^\d{1,2}/\d{1,2}/\d{4}$",  # Dates
-            r"^[A-Z][a-z]+,\s[A-Z]{2}$",  # City, State format
-            r"^[A-Z]{2}$",  # Two letter country codes (but not companies like HP)
-        ]
-
-        for pattern in non_company_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return False
-
-        # Positive indicators for company names
-        company_indicators = [
-            r".*(?:Corp|Corporation|Inc|Incorporated|Ltd|Limited|Co\.|Company|LLC|Group|Holdings|Technologies|Systems|Solutions|Industries|Manufacturing|Electronics|Semiconductor).*",
-            r".*(?:Precision|Micro|Tech|Electric|Digital|Global|International|Advanced|Automotive|Industrial).*",
-        ]
+        if _NON_COMPANY_PATTERN_SET.matches(text):
+            return False
 
         # Check corporate suffixes
-        for pattern in company_indicators:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
+        if _COMPANY_INDICATOR_PATTERN_SET.matches(text):
+            return True
 
         # Check if it looks like a proper company name
         # Allow shorter names (1-2 characters) if they contain letters and numbers (like 3M)
-        if re.match(r"^[A-Z0-9][A-Za-z0-9\s&\-\.\,\(\)]*$", text):
+        if _VALID_NAME_RE.match(text):
             # For very short names, be more restrictive
             if len(text) <= 3:
                 # Allow if it contains both letters and numbers, or is all caps with letters
                 if (
-                    re.search(r"[A-Za-z]", text) and re.search(r"[0-9]", text)
+                    _HAS_LETTER_RE.search(text) and _HAS_DIGIT_RE.search(text)
                 ) or text.isupper():
                     return True
             # For longer names, allow if reasonable length
@@ -172,13 +376,15 @@ class AppleSupplierParser:
 
         return False
 
-    def clean_company_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def clean_company_name(name: str) -> str:
         """Clean and normalize company names."""
         # Remove extra whitespace
-        name = re.sub(r"\s+", " ", name.strip())
+        name = _WS_RE.sub(" ", name.strip())
 
         # Remove page numbers and other artifacts
-        name = re.sub(r"^\d+\s+", "", name)
+        name = _LEADING_NUMBER_RE.sub("", name)
 
         # Remove common PDF artifacts
         artifacts = ["●", "•", "▪", "▫", "◦"]
@@ -187,124 +393,175 @@ class AppleSupplierParser:
 
         return name.strip()
 
-    def search_ticker(self, company_name: str) -> Optional[str]:
-        """Search for a company's stock ticker using yahooquery."""
-        try:
-            # Create search variations
-            search_terms = []
-
-            # Original name
-            search_terms.append(company_name)
-
-            # Remove common corporate suffixes
-            clean_name = re.sub(
-                r"\b(Corp|Corporation|Inc|Incorporated|Ltd|Limited|Co\.|Company|LLC|Group|Holdings|Technologies|Tech|Systems|Solutions|Industries|Manufacturing|Electronics|Semiconductor)\b",
-                "",
-                company_name,
-                flags=re.IGNORECASE,
-            ).strip()
-            if clean_name and clean_name != company_name:
-                search_terms.append(clean_name)
-
-            # First word only (often the main brand)
-            first_word = company_name.split()[0]
-            if len(first_word) > 2:
-                search_terms.append(first_word)
-
-            for term in search_terms:
-                if len(term) < 2:
-                    continue
-
-                try:
-                    # Use yahooquery search
-                    results = search(term)
-
-                    if results and "quotes" in results and len(results["quotes"]) > 0:
-                        # Get the first match
-                        quote = results["quotes"][0]
-                        if "symbol" in quote and quote["symbol"]:
-                            # Verify it's a stock (not ETF, option, etc.)
-                            if quote.get("quoteType", "").upper() == "EQUITY":
-                                return quote["symbol"]
-                            # If no quoteType, still return the symbol
-                            elif "quoteType" not in quote:
-                                return quote["symbol"]
-
-                except Exception as e:
-                    print(f"Error searching ticker for {term}: {e}")
-                    continue
-
+    def search_terms(self, company_name: str) -> List[str]:
+        """Build the search variations for a company name, most specific first."""
+        # Original name
+        search_terms = [company_name]
+
+        # Remove common corporate suffixes
+        clean_name = _SUFFIX_RE.sub("", company_name).strip()
+        if clean_name and clean_name != company_name:
+            search_terms.append(clean_name)
+
+        # First word only (often the main brand)
+        words = company_name.split()
+        if words and len(words[0]) > 2:
+            search_terms.append(words[0])
+
+        return [term for term in search_terms if len(term) >= 2]
+
+    def lookup_term(self, term: str) -> Optional[str]:
+        """Resolve one search term to an equity ticker, using the disk cache."""
+        key = term.lower()
+        with self.search_cache_lock:
+            entry = self.search_cache.get(key)
+        if entry is not None and time.time() - entry["cached_at"] < SEARCH_CACHE_TTL:
+            return entry["ticker"]
+
+        # Use yahooquery search. A rate-limited reply comes back as a non-JSON
+        # page, which yahooquery surfaces as a ValueError; only that is retried
+        delay = SEARCH_BACKOFF_BASE
+        for attempt in range(SEARCH_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            try:
+                results = search(term)
+                break
+            except ValueError:
+                if attempt < SEARCH_MAX_RETRIES:
+                    time.sleep(delay)
+                    delay *= 2
+        else:
             return None
 
-        except Exception as e:
-            print(f"Error searching ticker for {company_name}: {e}")
+        # Only cache real answers, not error payloads
+        if not isinstance(results, dict) or "quotes" not in results:
             return None
 
-    def search_ticker_with_progress(self, supplier_info: tuple) -> tuple:
-        """Search for ticker with progress tracking - thread-safe wrapper."""
-        index, supplier = supplier_info
-
-        # Add small delay to avoid overwhelming the API
-        time.sleep(0.1)
+        ticker = None
+        if len(results["quotes"]) > 0:
+            # Get the first match
+            quote = results["quotes"][0]
+            if "symbol" in quote and quote["symbol"]:
+                # Verify it's a stock (not ETF, option, etc.)
+                if quote.get("quoteType", "").upper() == "EQUITY":
+                    ticker = quote["symbol"]
+                # If no quoteType, still return the symbol
+                elif "quoteType" not in quote:
+                    ticker = quote["symbol"]
+
+        # Misses are cached too, so reruns skip known dead ends
+        with self.search_cache_lock:
+            self.search_cache[key] = {"ticker": ticker, "cached_at": time.time()}
+        return ticker
+
+    def load_search_cache(self) -> Dict[str, dict]:
+        """Load cached Yahoo search results from previous runs."""
+        try:
+            with open(SEARCH_CACHE_FILE) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable search cache {SEARCH_CACHE_FILE}: {e}")
+            return {}
+
+    def save_search_cache(self):
+        """Atomically persist cached Yahoo search results for the next run."""
+        cache_dir = SEARCH_CACHE_FILE.parent
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with self.search_cache_lock:
+            data = json.dumps(self.search_cache)
+
+        # Write to a temporary file first so an interrupted save never leaves
+        # a torn cache
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            f.write(data)
+        os.replace(f.name, SEARCH_CACHE_FILE)
+
+    def search_ticker_with_progress(self, term: str) -> tuple:
+        """Resolve one search term to (term, ticker), reporting errors as a miss."""
+        try:
+            ticker = self.lookup_term(term)
+        except Exception as e:
+            print(f"Error searching ticker for {term}: {e}")
+            ticker = None
 
-        ticker = self.search_ticker(supplier)
+        return (term, ticker)
 
-        return (supplier, ticker)
+    def _resolve_terms(
+        self, terms: set, max_workers: int, pbar: tqdm
+    ) -> Dict[str, Optional[str]]:
+        """Look up each unique search term once across a thread pool."""
+        term_to_ticker = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each result carries its own term, so no future-to-term map is needed
+            futures = [
+                executor.submit(self.search_ticker_with_progress, term)
+                for term in terms
+            ]
+            for future in as_completed(futures):
+                term, ticker = future.result()
+                term_to_ticker[term] = ticker
+                pbar.update(1)
+        return term_to_ticker
 
     def find_tickers(self, max_workers: int = 10) -> Dict[str, str]:
         """Find stock tickers for all suppliers using multithreading."""
         print(f"Searching for stock tickers using {max_workers} threads...")
         tickers = {}
 
-        # Create list of (index, supplier) tuples for progress tracking
-        supplier_items = list(enumerate(self.suppliers))
-
-        # Use ThreadPoolExecutor for concurrent ticker searches with progress bar
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_supplier = {
-                executor.submit(self.search_ticker_with_progress, item): item[1]
-                for item in supplier_items
-            }
-
-            # Process completed tasks with progress bar
-            completed_count = 0
-            found_count = 0
+        # Many suppliers share a brand or cleaned name, so collect the
+        # variations up front and query each distinct term only once
+        supplier_terms = {
+            supplier: self.search_terms(supplier) for supplier in self.suppliers
+        }
+        term_to_ticker = {}
 
+        # Save whatever was looked up even if the run is interrupted
+        try:
             with tqdm(
-                total=len(supplier_items),
+                total=0,
                 desc="Finding tickers",
                 bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
             ) as pbar:
-                for future in as_completed(future_to_supplier):
-                    try:
-                        supplier, ticker = future.result()
-                        completed_count += 1
-
-                        if ticker:
-                            tickers[supplier] = ticker
-                            found_count += 1
+                pending = list(supplier_terms)
+                while pending:
+                    # Each supplier asks for its next unresolved variation only, so
+                    # later variations are never queried once an earlier one hits
+                    wanted = set()
+                    still_pending = []
+                    for supplier in pending:
+                        for term in supplier_terms[supplier]:
+                            if term not in term_to_ticker:
+                                wanted.add(term)
+                                still_pending.append(supplier)
+                                break
+                            if term_to_ticker[term]:
+                                tickers[supplier] = term_to_ticker[term]
+                                break
                         else:
                             # Store None for suppliers without tickers
                             tickers[supplier] = None
 
-                        # Update description with stable counts instead of variable text
-                        pbar.set_description(
-                            f"Finding tickers (found: {found_count}/{completed_count})"
+                    pending = still_pending
+                    if wanted:
+                        pbar.total += len(wanted)
+                        pbar.refresh()
+                        term_to_ticker.update(
+                            self._resolve_terms(wanted, max_workers, pbar)
                         )
 
-                    except Exception as e:
-                        supplier = future_to_supplier[future]
-                        completed_count += 1
-                        tickers[supplier] = None  # Store None for errors too
-                        pbar.set_description(
-                            f"Finding tickers (found: {found_count}/{completed_count})"
-                        )
-                        print(f"Error processing {supplier}: {e}")
-                    finally:
-                        pbar.update(1)
+                    found_count = sum(1 for ticker in tickers.values() if ticker)
+                    pbar.set_description(
+                        f"Finding tickers (found: {found_count}/{len(tickers)})"
+                    )
+        finally:
+            self.save_search_cache()
 
-        return tickers
+        # Keep the original supplier order in the result
+        return {supplier: tickers[supplier] for supplier in supplier_terms}
 
     def save_results(self):
         """Save the results to files in the data/ directory."""
@@ -315,8 +572,7 @@ class AppleSupplierParser:
 
         # Save all suppliers to text file
         with open(data_dir / "apple_suppliers.txt", "w") as f:
-            for supplier in self.suppliers:
-                f.write(f"{supplier}\n")
+            f.writelines(f"{supplier}\n" for supplier in self.suppliers)
 
         # Save tickers to JSON
         with open(data_dir / "apple_supplier_tickers.json", "w") as f:
@@ -324,25 +580,27 @@ class AppleSupplierParser:
 
         # Save tickers to CSV
         df = pd.DataFrame(
-            [
-                {"Company": company, "Ticker": ticker}
-                for company, ticker in self.tickers.items()
-            ]
+            {
+                "Company": list(self.tickers.keys()),
+                "Ticker": list(self.tickers.values()),
+            }
         )
         df.to_csv(data_dir / "apple_supplier_tickers.csv", index=False)
 
-        # Save just the ticker list (only non-None tickers)
-        with open(data_dir / "ticker_list.txt", "w") as f:
-            for ticker in self.tickers.values():
+        # Save the ticker list and the found-only JSON in one pass
+        # (only non-None tickers)
+        found_tickers = {}
+        with (
+            open(data_dir / "ticker_list.txt", "w") as ticker_file,
+            open(data_dir / "found_tickers_only.json", "w") as found_file,
+        ):
+            for company, ticker in self.tickers.items():
                 if ticker is not None:
-                    f.write(f"{ticker}\n")
-
-        # Save only found tickers to a separate file
-        found_tickers = {k: v for k, v in self.tickers.items() if v is not None}
-        with open(data_dir / "found_tickers_only.json", "w") as f:
-            json.dump(found_tickers, f, indent=2)
+                    ticker_file.write(f"{ticker}\n")
+                    found_tickers[company] = ticker
+            json.dump(found_tickers, found_file, indent=2)
 
-        found_count = len([t for t in self.tickers.values() if t is not None])
+        found_count = len(found_tickers)
 
         print(f"\nResults saved to {data_dir}:")
         print(f"  All suppliers: apple_suppliers.txt ({len(self.suppliers)} companies)")
@@ -1,6 +1,20 @@
 import pandas as pd
 import os
 
+try:
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+
+def read_trades_csv(input_filepath):
+    """
+    Reads the trades CSV, with PyArrow's multithreaded reader when installed.
+    """
+    if pa_csv is not None:
+        return pa_csv.read_csv(input_filepath).to_pandas()
+    return pd.read_csv(input_filepath)
+
 
 def format_trades_for_yahoo(input_filepath, output_filepath):
     """
@@ -12,7 +26,7 @@ def format_trades_for_yahoo(input_filepath, output_filepath):
         # col_5: Date/Time, col_6: Quantity, col_7: T. Price, col_8: C. Price,
         # col_9: Proceeds, col_10: Comm/Fee, col_11: Basis, col_12: Realized P/L,
         # col_13: MTM P/L, col_14: Code
-        df = pd.read_csv(input_filepath)
+        df = read_trades_csv(input_filepath)
 
         # Remove SubTotal and Total rows
         df = df[df["DataDiscriminator"] == "Order"]
@@ -35,9 +49,13 @@ def format_trades_for_yahoo(input_filepath, output_filepath):
         # Add the 'Action' column
         yahoo_df["Transaction Type"] = None
 
-        # Convert 'Trade Date' to the required format (YYYY-MM-DD)
-        yahoo_df["Trade Date"] = pd.to_datetime(yahoo_df["Trade Date"]).dt.strftime(
-            "%Y%m%d"
+        # Convert 'Trade Date' to the required format (YYYYMMDD), built from
+        # the date parts rather than a per-row strftime
+        dates = pd.to_datetime(yahoo_df["Trade Date"]).dt
+        yahoo_df["Trade Date"] = (
+            (dates.year * 10000 + dates.month * 100 + dates.day)
+            .astype("Int64")
+            .astype("string")
         )
 
         # Ensure 'Quantity' is positive for both buys and sells
@@ -67,25 +85,25 @@ def format_trades_for_yahoo(input_filepath, output_filepath):
             "Transaction Type",
         ]
 
-        # Add missing columns with default values
-        for column in required_columns:
-            if column not in yahoo_df.columns:
-                if column in [
-                    "Current Price",
-                    "Change",
-                    "Open",
-                    "High",
-                    "Low",
-                    "Volume",
-                    "High Limit",
-                    "Low Limit",
-                ]:
-                    yahoo_df[column] = None  # Default numerical value
-                else:
-                    yahoo_df[column] = ""  # Default string value
-
-        # Reorder columns to match the specified order
-        yahoo_df = yahoo_df[required_columns]
+        # Add missing columns with default values and reorder them in a
+        # single reindex; numerical columns default to empty (NaN)
+        numerical_columns = [
+            "Current Price",
+            "Change",
+            "Open",
+            "High",
+            "Low",
+            "Volume",
+            "High Limit",
+            "Low Limit",
+        ]
+        missing_string_columns = [
+            column
+            for column in required_columns
+            if column not in yahoo_df.columns and column not in numerical_columns
+        ]
+        yahoo_df = yahoo_df.reindex(columns=required_columns)
+        yahoo_df[missing_string_columns] = ""  # Default string value
 
         # Save to a new CSV file
         os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
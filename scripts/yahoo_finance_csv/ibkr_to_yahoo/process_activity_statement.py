@@ -12,47 +12,23 @@ def sanitize_filename(name):
     return s.lower()
 
 
-def process_activity_statement(filepath, output_dir):
-    """
-    Parses an IBKR activity statement CSV and saves each section into a separate CSV file.
+def read_tables(lines):
+    r"""
+    Splits statement lines into tables of header names and data rows.
+
+    Quoted cells may span lines:
+
+    >>> import io
+    >>> statement = io.StringIO('Trades,Header,"A\nB",C\nTrades,Data,1,"x\ny",3,4\n')
+    >>> [(t["name"], t["header"], t["data"]) for t in read_tables(statement)]
+    [('Trades', ['A\nB', 'C'], [['1', 'x\ny']])]
     """
     tables = []
     current_statement = None
     current_header = None
     current_data = []
 
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if not row or len(row) < 2:
-                    continue
-
-                statement_name, row_type, *content = row
-
-                if row_type == "Header":
-                    if current_statement and current_header and current_data:
-                        tables.append(
-                            {
-                                "name": current_statement,
-                                "header": current_header,
-                                "data": current_data,
-                            }
-                        )
-
-                    current_statement = statement_name
-                    current_header = content
-                    current_data = []
-                elif row_type == "Data" and current_header:
-                    if statement_name == current_statement:
-                        # Pad data row to match header length if necessary
-                        num_missing_cols = len(current_header) - len(content)
-                        if num_missing_cols > 0:
-                            content.extend([""] * num_missing_cols)
-                        elif num_missing_cols < 0:
-                            content = content[: len(current_header)]
-                        current_data.append(content)
-
+    def flush():
         if current_statement and current_header and current_data:
             tables.append(
                 {
@@ -62,6 +38,39 @@ def process_activity_statement(filepath, output_dir):
                 }
             )
 
+    for row in csv.reader(lines):
+        if not row or len(row) < 2:
+            continue
+
+        statement_name, row_type, *content = row
+
+        if row_type == "Header":
+            flush()
+            current_statement = statement_name
+            current_header = content
+            current_data = []
+        elif row_type == "Data" and current_header:
+            if statement_name == current_statement:
+                # Pad data row to match header length if necessary
+                num_missing_cols = len(current_header) - len(content)
+                if num_missing_cols > 0:
+                    content.extend([""] * num_missing_cols)
+                elif num_missing_cols < 0:
+                    content = content[: len(current_header)]
+                current_data.append(content)
+
+    flush()
+    return tables
+
+
+def process_activity_statement(filepath, output_dir):
+    """
+    Parses an IBKR activity statement CSV and saves each section into a separate CSV file.
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            tables = read_tables(f)
+
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
@@ -1,14 +1,44 @@
+import numpy as np
 import pandas as pd
 import os
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa_csv = None
 
-def format_swissquote_transactions_for_yahoo(input_filepath, output_filepath):
+DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+
+
+def read_transactions_csv(input_filepath):
+    """
+    Reads the transactions CSV, with PyArrow's multithreaded reader when installed.
+    """
+    if pa_csv is not None:
+        # Parse 'Date' while reading so it arrives as a datetime column
+        table = pa_csv.read_csv(
+            input_filepath,
+            parse_options=pa_csv.ParseOptions(delimiter=";"),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={"Date": pa.timestamp("s")},
+                timestamp_parsers=[DATE_FORMAT],
+            ),
+        )
+        return table.to_pandas()
+    return pd.read_csv(input_filepath, delimiter=";")
+
+
+def format_swissquote_transactions_for_yahoo(
+    input_filepath, output_filepath, negate_sell_prices=False
+):
     """
     Formats a Swissquote transactions CSV file for Yahoo Finance import.
+    Set negate_sell_prices to record 'Sell' rows with a negative price.
     """
     try:
         # Read the CSV file, specifying the delimiter
-        df = pd.read_csv(input_filepath, delimiter=";")
+        df = read_transactions_csv(input_filepath)
 
         # Consider 'Buy', 'Sell', and 'Crypto Deposit' as transactions
         df = df[df["Transaction"].isin(["Buy", "Sell", "Crypto Deposit"])]
@@ -28,17 +58,25 @@ def format_swissquote_transactions_for_yahoo(input_filepath, output_filepath):
         yahoo_df.rename(columns=rename_map, inplace=True)
 
         # Convert 'Trade Date' to the required format (YYYY-MM-DD)
-        yahoo_df["Trade Date"] = pd.to_datetime(
-            yahoo_df["Trade Date"], format="%d-%m-%Y %H:%M:%S"
-        ).dt.strftime("%Y%m%d")
-
-        # # Adjust 'Purchase Price' to be negative for 'Sell'
-        # yahoo_df["Purchase Price"] = yahoo_df.apply(
-        #     lambda row: -row["Purchase Price"]
-        #     if row["Transaction Type"].lower() == "sell"
-        #     else row["Purchase Price"],
-        #     axis=1,
-        # )
+        trade_dates = yahoo_df["Trade Date"]
+        if not pd.api.types.is_datetime64_any_dtype(trade_dates):
+            trade_dates = pd.to_datetime(trade_dates, format=DATE_FORMAT)
+        # Build YYYYMMDD from the date parts instead of a per-row strftime
+        dates = trade_dates.dt
+        yahoo_df["Trade Date"] = (
+            (dates.year * 10000 + dates.month * 100 + dates.day)
+            .astype("Int64")
+            .astype("string")
+        )
+
+        # Adjust 'Purchase Price' to be negative for 'Sell', column-wise with
+        # np.where rather than a row-by-row DataFrame.apply
+        if negate_sell_prices:
+            yahoo_df["Purchase Price"] = np.where(
+                yahoo_df["Transaction Type"].str.lower() == "sell",
+                -yahoo_df["Purchase Price"],
+                yahoo_df["Purchase Price"],
+            )
         yahoo_df["Commission"] = yahoo_df["Commission"].abs()
 
         # Ensure all required columns are present in the DataFrame
@@ -63,29 +101,31 @@ def format_swissquote_transactions_for_yahoo(input_filepath, output_filepath):
         ]
 
         # Replace 'BTC' with 'BTC-USD' and 'ETH' with 'ETH-USD' in the 'Symbol' column
-        yahoo_df["Symbol"] = yahoo_df["Symbol"].replace(
-            {"BTC": "BTC-USD", "ETH": "ETH-USD"}
+        yahoo_df["Symbol"] = (
+            yahoo_df["Symbol"]
+            .map({"BTC": "BTC-USD", "ETH": "ETH-USD"})
+            .fillna(yahoo_df["Symbol"])
         )
 
-        # Add missing columns with default values
-        for column in required_columns:
-            if column not in yahoo_df.columns:
-                if column in [
-                    "Current Price",
-                    "Change",
-                    "Open",
-                    "High",
-                    "Low",
-                    "Volume",
-                    "High Limit",
-                    "Low Limit",
-                ]:
-                    yahoo_df[column] = None  # Default numerical value
-                else:
-                    yahoo_df[column] = ""  # Default string value
-
-        # Reorder columns to match the specified order
-        yahoo_df = yahoo_df[required_columns]
+        # Add missing columns with default values and reorder them in a
+        # single reindex; numerical columns default to empty (NaN)
+        numerical_columns = [
+            "Current Price",
+            "Change",
+            "Open",
+            "High",
+            "Low",
+            "Volume",
+            "High Limit",
+            "Low Limit",
+        ]
+        missing_string_columns = [
+            column
+            for column in required_columns
+            if column not in yahoo_df.columns and column not in numerical_columns
+        ]
+        yahoo_df = yahoo_df.reindex(columns=required_columns)
+        yahoo_df[missing_string_columns] = ""  # Default string value
 
         # Save the formatted data to a new CSV file
         os.makedirs(os.path.dirname(output_filepath), exist_ok=True)
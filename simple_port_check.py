@@ -4,6 +4,7 @@ Simple port connectivity checker for IBKR
 """
 
 import socket
+from concurrent.futures import ThreadPoolExecutor
 
 
 def check_port(host, port):
@@ -23,9 +24,12 @@ def main():
     ports = [7497, 7496, 4002, 4001]
 
     print("Checking IBKR ports...")
-    for port in ports:
-        status = "OPEN" if check_port(host, port) else "CLOSED"
-        print(f"Port {port}: {status}")
+    # Probe all ports at once so a closed TWS costs one timeout, not four
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        results = executor.map(lambda port: check_port(host, port), ports)
+        for port, is_open in zip(ports, results):
+            status = "OPEN" if is_open else "CLOSED"
+            print(f"Port {port}: {status}")
 
 
 if __name__ == "__main__":